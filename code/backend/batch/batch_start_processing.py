@@ -1,6 +1,7 @@
 import os
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 import azure.functions as func
 from utilities.helpers.embedders.integrated_vectorization_embedder import (
     IntegratedVectorizationEmbedder,
@@ -14,6 +15,8 @@ from utilities.helpers.azure_blob_storage_client import (
 bp_batch_start_processing = func.Blueprint()
 logger = logging.getLogger(__name__)
 logger.setLevel(level=os.environ.get("LOGLEVEL", "INFO").upper())
+# Bounds the concurrent queue requests when fanning out a batch of documents
+MAX_QUEUE_SEND_WORKERS = 16
 
 
 @bp_batch_start_processing.route(route="BatchStartProcessing")
@@ -30,10 +33,17 @@ def batch_start_processing(req: func.HttpRequest) -> func.HttpResponse:
     if env_helper.AZURE_SEARCH_USE_INTEGRATED_VECTORIZATION:
         reprocess_integrated_vectorization(env_helper)
     else:
-        # Send a message to the queue for each file
+        # Send a message to the queue for each file, overlapping the round trips
         queue_client = create_queue_client()
-        for fd in files_data:
-            queue_client.send_message(json.dumps(fd).encode("utf-8"))
+        with ThreadPoolExecutor(max_workers=MAX_QUEUE_SEND_WORKERS) as executor:
+            list(
+                executor.map(
+                    lambda fd: queue_client.send_message(
+                        json.dumps(fd).encode("utf-8")
+                    ),
+                    files_data,
+                )
+            )
 
     return func.HttpResponse(
         f"Conversion started successfully for {len(files_data)} documents.",
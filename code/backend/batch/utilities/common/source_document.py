@@ -1,11 +1,40 @@
-from typing import Optional, Type
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type
 import hashlib
 import json
 from urllib.parse import urlparse, quote
 from ..helpers.azure_blob_storage_client import AzureBlobStorageClient
 
 
+# All chunks of a document share its URL, so parse it once per document.
+# The returned hasher has already absorbed the "<file_url>_" id prefix and
+# must only be used via copy().
+@lru_cache(maxsize=256)
+def _parse_document_url(document_url: Optional[str]) -> Tuple[str, str, str, Any]:
+    parsed_url = urlparse(document_url)
+    file_url = parsed_url.scheme + "://" + parsed_url.netloc + parsed_url.path
+    sas_placeholder = (
+        "_SAS_TOKEN_PLACEHOLDER_"
+        if parsed_url.netloc and parsed_url.netloc.endswith(".blob.core.windows.net")
+        else ""
+    )
+    id_prefix_hasher = hashlib.sha1(f"{file_url}_".encode("utf-8"))
+    return file_url, parsed_url.path, sas_placeholder, id_prefix_hasher
+
+
 class SourceDocument:
+    # A document is chunked into many instances, so avoid a per-instance __dict__
+    __slots__ = (
+        "id",
+        "content",
+        "source",
+        "title",
+        "chunk",
+        "offset",
+        "page_number",
+        "chunk_id",
+    )
+
     def __init__(
         self,
         content: str,
@@ -43,24 +72,36 @@ class SourceDocument:
             )
         return False
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "content": self.content,
+            "source": self.source,
+            "title": self.title,
+            "chunk": self.chunk,
+            "offset": self.offset,
+            "page_number": self.page_number,
+            "chunk_id": self.chunk_id,
+        }
+
     def to_json(self):
-        return json.dumps(self, cls=SourceDocumentEncoder)
+        return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_string):
-        return json.loads(json_string, cls=SourceDocumentDecoder)
+        return cls.from_dict(json.loads(json_string))
 
     @classmethod
     def from_dict(cls, dict_obj):
         return cls(
-            dict_obj["id"],
-            dict_obj["content"],
-            dict_obj["source"],
-            dict_obj["title"],
-            dict_obj["chunk"],
-            dict_obj["offset"],
-            dict_obj["page_number"],
-            dict_obj["chunk_id"],
+            id=dict_obj["id"],
+            content=dict_obj["content"],
+            source=dict_obj["source"],
+            title=dict_obj["title"],
+            chunk=dict_obj["chunk"],
+            offset=dict_obj["offset"],
+            page_number=dict_obj["page_number"],
+            chunk_id=dict_obj["chunk_id"],
         )
 
     @classmethod
@@ -71,17 +112,12 @@ class SourceDocument:
         document_url: Optional[str],
         idx: Optional[int],
     ) -> "SourceDocument":
-        parsed_url = urlparse(document_url)
-        file_url = parsed_url.scheme + "://" + parsed_url.netloc + parsed_url.path
-        filename = parsed_url.path
-        hash_key = hashlib.sha1(f"{file_url}_{idx}".encode("utf-8")).hexdigest()
-        hash_key = f"doc_{hash_key}"
-        sas_placeholder = (
-            "_SAS_TOKEN_PLACEHOLDER_"
-            if parsed_url.netloc
-            and parsed_url.netloc.endswith(".blob.core.windows.net")
-            else ""
+        file_url, filename, sas_placeholder, id_prefix_hasher = _parse_document_url(
+            document_url
         )
+        hasher = id_prefix_hasher.copy()
+        hasher.update(f"{idx}".encode("utf-8"))
+        hash_key = f"doc_{hasher.hexdigest()}"
         return cls(
             id=metadata.get("id", hash_key),
             content=content,
@@ -110,34 +146,3 @@ class SourceDocument:
             container_sas = blob_client.get_container_sas()
             url = url.replace("_SAS_TOKEN_PLACEHOLDER_", container_sas)
         return f"[{self.title}]({url})"
-
-
-class SourceDocumentEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, SourceDocument):
-            return {
-                "id": obj.id,
-                "content": obj.content,
-                "source": obj.source,
-                "title": obj.title,
-                "chunk": obj.chunk,
-                "offset": obj.offset,
-                "page_number": obj.page_number,
-                "chunk_id": obj.chunk_id,
-            }
-        return super().default(obj)
-
-
-class SourceDocumentDecoder(json.JSONDecoder):
-    def decode(self, s, **kwargs):
-        obj = super().decode(s, **kwargs)
-        return SourceDocument(
-            id=obj["id"],
-            content=obj["content"],
-            source=obj["source"],
-            title=obj["title"],
-            chunk=obj["chunk"],
-            offset=obj["offset"],
-            page_number=obj["page_number"],
-            chunk_id=obj["chunk_id"],
-        )
@@ -1,9 +1,25 @@
 # Create an abstract class for document loading
-from typing import List
+import logging
+from functools import lru_cache
+from typing import List, Type
 from abc import ABC, abstractmethod
+from langchain.text_splitter import TextSplitter
 from ..common.source_document import SourceDocument
 from .chunking_strategy import ChunkingSettings
 
+logger = logging.getLogger(__name__)
+
+
+# Building a tiktoken-backed splitter is comparatively expensive, and the
+# chunking settings rarely change between documents
+@lru_cache(maxsize=8)
+def get_text_splitter(
+    splitter_class: Type[TextSplitter], chunk_size: int, chunk_overlap: int
+) -> TextSplitter:
+    return splitter_class.from_tiktoken_encoder(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+
 
 class DocumentChunkingBase(ABC):
     def __init__(self) -> None:
@@ -14,3 +30,22 @@ class DocumentChunkingBase(ABC):
         self, documents: List[SourceDocument], chunking: ChunkingSettings
     ) -> List[SourceDocument]:
         pass
+
+    def _get_chunk_offsets(self, content: str, chunks: List[str]) -> List[int]:
+        # Locate each chunk in the source content, searching forward from the
+        # previous match so that overlapping chunks resolve to their own position
+        offsets = []
+        cursor = 0
+        previous_chunk_end = 0
+        for idx, chunk in enumerate(chunks):
+            offset = content.find(chunk, cursor)
+            if offset == -1:
+                # A token split inside a multi-byte character alters the chunk text
+                logger.warning(
+                    f"Chunk {idx} was not found in the document content, using the end of the previous chunk as its offset"
+                )
+                offset = previous_chunk_end
+            offsets.append(offset)
+            cursor = offset + 1
+            previous_chunk_end = offset + len(chunk)
+        return offsets
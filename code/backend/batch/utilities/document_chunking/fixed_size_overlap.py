@@ -1,5 +1,5 @@
 from typing import List
-from .document_chunking_base import DocumentChunkingBase
+from .document_chunking_base import DocumentChunkingBase, get_text_splitter
 from langchain.text_splitter import TokenTextSplitter
 from .chunking_strategy import ChunkingSettings
 from ..common.source_document import SourceDocument
@@ -12,25 +12,25 @@ class FixedSizeOverlapDocumentChunking(DocumentChunkingBase):
     def chunk(
         self, documents: List[SourceDocument], chunking: ChunkingSettings
     ) -> List[SourceDocument]:
-        full_document_content = "".join(
-            list(map(lambda document: document.content, documents))
-        )
+        full_document_content = "".join(document.content for document in documents)
         document_url = documents[0].source
-        splitter = TokenTextSplitter.from_tiktoken_encoder(
-            chunk_size=chunking.chunk_size, chunk_overlap=chunking.chunk_overlap
+        splitter = get_text_splitter(
+            TokenTextSplitter, chunking.chunk_size, chunking.chunk_overlap
         )
         chunked_content_list = splitter.split_text(full_document_content)
+        chunk_offsets = self._get_chunk_offsets(
+            full_document_content, chunked_content_list
+        )
         # Create document for each chunk
-        documents = []
-        chunk_offset = 0
-        for idx, chunked_content in enumerate(chunked_content_list):
-            documents.append(
-                SourceDocument.from_metadata(
-                    content=chunked_content,
-                    document_url=document_url,
-                    metadata={"offset": chunk_offset},
-                    idx=idx,
-                )
+        documents = [
+            SourceDocument.from_metadata(
+                content=chunked_content,
+                document_url=document_url,
+                metadata={"offset": chunk_offset},
+                idx=idx,
+            )
+            for idx, (chunked_content, chunk_offset) in enumerate(
+                zip(chunked_content_list, chunk_offsets)
             )
-            chunk_offset += len(chunked_content)
+        ]
         return documents
@@ -1,5 +1,5 @@
 from typing import List
-from .document_chunking_base import DocumentChunkingBase
+from .document_chunking_base import DocumentChunkingBase, get_text_splitter
 from langchain.text_splitter import MarkdownTextSplitter
 from .chunking_strategy import ChunkingSettings
 from ..common.source_document import SourceDocument
@@ -13,8 +13,8 @@ class PageDocumentChunking(DocumentChunkingBase):
         self, documents: List[SourceDocument], chunking: ChunkingSettings
     ) -> List[SourceDocument]:
         document_url = documents[0].source
-        splitter = MarkdownTextSplitter.from_tiktoken_encoder(
-            chunk_size=chunking.chunk_size, chunk_overlap=chunking.chunk_overlap
+        splitter = get_text_splitter(
+            MarkdownTextSplitter, chunking.chunk_size, chunking.chunk_overlap
         )
         documents_chunked = []
         for idx, document in enumerate(documents):
@@ -1,8 +1,6 @@
 from enum import Enum
-from .layout import LayoutDocumentLoading
-from .read import ReadDocumentLoading
-from .web import WebDocumentLoading
-from .word_document import WordDocumentLoading
+from functools import lru_cache
+from importlib import import_module
 
 
 class LoadingStrategy(Enum):
@@ -12,14 +10,22 @@ class LoadingStrategy(Enum):
     DOCX = "docx"
 
 
+# Loaders pull in heavy dependencies (Document Intelligence, LangChain's web
+# loader, python-docx), so each module is only imported once it is first used
+_document_loaders = {
+    LoadingStrategy.LAYOUT.value: (".layout", "LayoutDocumentLoading"),
+    LoadingStrategy.READ.value: (".read", "ReadDocumentLoading"),
+    LoadingStrategy.WEB.value: (".web", "WebDocumentLoading"),
+    LoadingStrategy.DOCX.value: (".word_document", "WordDocumentLoading"),
+}
+
+
+# Loaders hold no per-document state, so a single instance of each is shared
+@lru_cache(maxsize=None)
 def get_document_loader(loader_strategy: str):
-    if loader_strategy == LoadingStrategy.LAYOUT.value:
-        return LayoutDocumentLoading()
-    elif loader_strategy == LoadingStrategy.READ.value:
-        return ReadDocumentLoading()
-    elif loader_strategy == LoadingStrategy.WEB.value:
-        return WebDocumentLoading()
-    elif loader_strategy == LoadingStrategy.DOCX.value:
-        return WordDocumentLoading()
-    else:
+    try:
+        module_name, class_name = _document_loaders[loader_strategy]
+    except KeyError:
         raise Exception(f"Unknown loader strategy: {loader_strategy}")
+    loader_class = getattr(import_module(module_name, __package__), class_name)
+    return loader_class()
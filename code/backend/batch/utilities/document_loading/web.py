@@ -4,27 +4,29 @@ from langchain_community.document_loaders import WebBaseLoader
 from .document_loading_base import DocumentLoadingBase
 from ..common.source_document import SourceDocument
 
+_EXCESS_NEWLINES_PATTERN = re.compile("\n{3,}")
+# Matches half non-ascii characters left at the start/end of doc content
+_NON_ASCII_PATTERN = re.compile(
+    r"[\x00-\x1f\x7f\u0080-\u00a0\u2000-\u3000\ufff0-\uffff]"
+)
+
 
 class WebDocumentLoading(DocumentLoadingBase):
     def __init__(self) -> None:
         super().__init__()
 
+    def _clean_content(self, content: str) -> str:
+        content = _EXCESS_NEWLINES_PATTERN.sub("\n\n", content)
+        return _NON_ASCII_PATTERN.sub("", content)
+
     def load(self, document_url: str) -> List[SourceDocument]:
         documents = WebBaseLoader(document_url).load()
-        for document in documents:
-            document.page_content = re.sub("\n{3,}", "\n\n", document.page_content)
-            # Remove half non-ascii character from start/end of doc content
-            pattern = re.compile(
-                r"[\x00-\x1f\x7f\u0080-\u00a0\u2000-\u3000\ufff0-\uffff]"
-            )
-            document.page_content = re.sub(pattern, "", document.page_content)
-            if document.page_content == "":
-                documents.remove(document)
         source_documents: List[SourceDocument] = [
             SourceDocument(
-                content=document.page_content,
+                content=content,
                 source=document.metadata["source"],
             )
             for document in documents
+            if (content := self._clean_content(document.page_content))
         ]
         return source_documents
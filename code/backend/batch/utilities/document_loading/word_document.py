@@ -1,10 +1,17 @@
-from typing import List
+from typing import List, Tuple
 from io import BytesIO
 from docx import Document
 import requests
+from requests.adapters import HTTPAdapter
 from .document_loading_base import DocumentLoadingBase
 from ..common.source_document import SourceDocument
 
+# Shared across loads so consecutive downloads reuse pooled keep-alive connections
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=2)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
 
 class WordDocumentLoading(DocumentLoadingBase):
     def __init__(self) -> None:
@@ -17,23 +24,31 @@ class WordDocumentLoading(DocumentLoadingBase):
             "Heading 5": "h5",
             "Heading 6": "h6",
         }
+        # Resolve the (opening, closing) tag pair per style once, rather than
+        # formatting both tags for every paragraph
+        self._markdown_tags = {
+            style: (f"<{tag}>", f"</{tag}>")
+            for style, tag in self.doc_headings_to_markdown_tags.items()
+        }
 
     def _download_document(self, document_url: str) -> BytesIO:
-        response = requests.get(document_url)
-        file = BytesIO(response.content)
-        return file
+        with _session.get(document_url, timeout=(5, 60)) as response:
+            response.raise_for_status()
+            # BytesIO shares the response buffer until written to, so no copy is made
+            return BytesIO(response.content)
 
-    def _get_opening_tag(self, heading_level: int) -> str:
-        return f"<{self.doc_headings_to_markdown_tags.get(f'{heading_level}', '')}>"
+    def _get_tags(self, style_name: str) -> Tuple[str, str]:
+        return self._markdown_tags.get(style_name, ("<>", "</>"))
 
-    def _get_closing_tag(self, heading_level: int) -> str:
-        return f"</{self.doc_headings_to_markdown_tags.get(f'{heading_level}', '')}>"
+    def _to_markdown(self, paragraph) -> str:
+        opening_tag, closing_tag = self._get_tags(paragraph.style.name)
+        return f"{opening_tag}{paragraph.text}{closing_tag}\n"
 
     def load(self, document_url: str) -> List[SourceDocument]:
-        output = ""
         document = Document(self._download_document(document_url))
-        for paragraph in document.paragraphs:
-            output += f"{self._get_opening_tag(paragraph.style.name)}{paragraph.text}{self._get_closing_tag(paragraph.style.name)}\n"
+        output = "".join(
+            self._to_markdown(paragraph) for paragraph in document.paragraphs
+        )
         documents = [
             SourceDocument(
                 content=output,
@@ -74,9 +74,14 @@ class AzureSearchHelper:
     @property
     def search_dimensions(self) -> int:
         if AzureSearchHelper._search_dimension is None:
-            AzureSearchHelper._search_dimension = len(
-                self.llm_helper.get_embedding_model().embed_query("Text")
-            )
+            if self.env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS:
+                AzureSearchHelper._search_dimension = int(
+                    self.env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS
+                )
+            else:
+                AzureSearchHelper._search_dimension = len(
+                    self.llm_helper.get_embedding_model().embed_query("Text")
+                )
         return AzureSearchHelper._search_dimension
 
     @property
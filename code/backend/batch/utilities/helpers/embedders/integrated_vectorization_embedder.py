@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from .embedder_base import EmbedderBase
 from ..env_helper import EnvHelper
 from ..llm_helper import LLMHelper
@@ -23,13 +24,19 @@ class IntegratedVectorizationEmbedder(EmbedderBase):
         config = ConfigHelper.get_active_config_or_default()
         try:
             search_datasource = AzureSearchDatasource(self.env_helper)
-            search_datasource.create_or_update_datasource()
             search_index = AzureSearchIndex(self.env_helper, self.llm_helper)
-            search_index.create_or_update_index()
             search_skillset = AzureSearchSkillset(
                 self.env_helper, config.integrated_vectorization_config
             )
-            search_skillset_result = search_skillset.create_skillset()
+            # The skillset projects into the index so it has to wait for it, but the
+            # datasource is independent and can be provisioned alongside both
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                datasource_future = executor.submit(
+                    search_datasource.create_or_update_datasource
+                )
+                search_index.create_or_update_index()
+                search_skillset_result = search_skillset.create_skillset()
+                datasource_future.result()
             search_indexer = AzureSearchIndexer(self.env_helper)
             indexer_result = search_indexer.create_or_update_indexer(
                 self.env_helper.AZURE_SEARCH_INDEXER_NAME,
@@ -43,6 +50,8 @@ class IntegratedVectorizationEmbedder(EmbedderBase):
     def reprocess_all(self):
         search_indexer = AzureSearchIndexer(self.env_helper)
         if search_indexer.indexer_exists(self.env_helper.AZURE_SEARCH_INDEXER_NAME):
-            search_indexer.run_indexer(self.env_helper.AZURE_SEARCH_INDEXER_NAME)
+            search_indexer.run_indexer(
+                self.env_helper.AZURE_SEARCH_INDEXER_NAME, force_reset=True
+            )
         else:
             self.process_using_integrated_vectorization(source_url="all")
@@ -21,6 +21,12 @@ from ...common.source_document import SourceDocument
 
 logger = logging.getLogger(__name__)
 
+# Number of chunks embedded per request to the embeddings deployment
+EMBEDDING_BATCH_SIZE = 16
+# Number of documents uploaded per indexing request. Each document carries its
+# vector, so this keeps large files well under the service's 16 MB batch limit
+UPLOAD_BATCH_SIZE = 100
+
 
 class PushEmbedder(EmbedderBase):
     def __init__(self, blob_client: AzureBlobStorageClient, env_helper: EnvHelper):
@@ -76,15 +82,28 @@ class PushEmbedder(EmbedderBase):
                 documents, embedding_config.chunking
             )
 
-            for document in documents:
-                documents_to_upload.append(self.__convert_to_search_document(document))
+            for batch_start in range(0, len(documents), EMBEDDING_BATCH_SIZE):
+                batch_end = batch_start + EMBEDDING_BATCH_SIZE
+                batch = documents[batch_start:batch_end]
+                embeddings = self.llm_helper.generate_embeddings_batch(
+                    [document.content for document in batch]
+                )
+                documents_to_upload.extend(
+                    self.__convert_to_search_document(document, embedded_content)
+                    for document, embedded_content in zip(
+                        batch, embeddings, strict=True
+                    )
+                )
 
-        response = self.azure_search_helper.get_search_client().upload_documents(
-            documents_to_upload
-        )
-        if not all([r.succeeded for r in response]):
-            logger.error("Failed to upload documents to search index")
-            raise Exception(response)
+        search_client = self.azure_search_helper.get_search_client()
+        for batch_start in range(0, len(documents_to_upload), UPLOAD_BATCH_SIZE):
+            batch_end = batch_start + UPLOAD_BATCH_SIZE
+            response = search_client.upload_documents(
+                documents_to_upload[batch_start:batch_end]
+            )
+            if not all([r.succeeded for r in response]):
+                logger.error("Failed to upload documents to search index")
+                raise Exception(response)
 
     def __generate_image_caption(self, source_url):
         model = self.env_helper.AZURE_OPENAI_VISION_MODEL
@@ -112,17 +131,11 @@ If the image is mostly text, use OCR to extract the text as it is displayed in t
         caption = response.choices[0].message.content
         return caption
 
-    def __convert_to_search_document(self, document: SourceDocument):
-        embedded_content = self.llm_helper.generate_embeddings(document.content)
-        metadata = {
-            "id": document.id,
-            "source": document.source,
-            "title": document.title,
-            "chunk": document.chunk,
-            "offset": document.offset,
-            "page_number": document.page_number,
-            "chunk_id": document.chunk_id,
-        }
+    def __convert_to_search_document(
+        self, document: SourceDocument, embedded_content: List[float]
+    ):
+        metadata = document.to_dict()
+        del metadata["content"]
         return {
             "id": document.id,
             "content": document.content,
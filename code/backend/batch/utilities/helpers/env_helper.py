@@ -14,12 +14,17 @@ class EnvHelper:
     _lock = threading.Lock()
 
     def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                instance = super(EnvHelper, cls).__new__(cls)
-                instance.__load_config()
-                cls._instance = instance
-            return cls._instance
+        # Only take the lock while the instance is being created, so the many
+        # EnvHelper() calls made once it exists never contend on it
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(EnvHelper, cls).__new__(cls)
+                    instance.__load_config()
+                    cls._instance = instance
+                instance = cls._instance
+        return instance
 
     def __load_config(self, **kwargs) -> None:
         load_dotenv()
@@ -80,6 +85,17 @@ class EnvHelper:
         self.AZURE_SEARCH_USE_INTEGRATED_VECTORIZATION = self.get_env_var_bool(
             "AZURE_SEARCH_USE_INTEGRATED_VECTORIZATION", "False"
         )
+        self.AZURE_SEARCH_USE_EXHAUSTIVE_KNN = self.get_env_var_bool(
+            "AZURE_SEARCH_USE_EXHAUSTIVE_KNN", "False"
+        )
+        # HNSW graph parameters for the integrated vectorization index
+        self.AZURE_SEARCH_HNSW_M = self.get_env_var_int("AZURE_SEARCH_HNSW_M", 4)
+        self.AZURE_SEARCH_HNSW_EF_CONSTRUCTION = self.get_env_var_int(
+            "AZURE_SEARCH_HNSW_EF_CONSTRUCTION", 400
+        )
+        self.AZURE_SEARCH_HNSW_EF_SEARCH = self.get_env_var_int(
+            "AZURE_SEARCH_HNSW_EF_SEARCH", 500
+        )
 
         self.AZURE_AUTH_TYPE = os.getenv("AZURE_AUTH_TYPE", "keys")
         # Azure OpenAI
@@ -104,6 +120,9 @@ class EnvHelper:
         self.AZURE_OPENAI_EMBEDDING_MODEL = os.getenv(
             "AZURE_OPENAI_EMBEDDING_MODEL", ""
         )
+        self.AZURE_OPENAI_EMBEDDING_DIMENSIONS = os.getenv(
+            "AZURE_OPENAI_EMBEDDING_DIMENSIONS", ""
+        )
         self.SHOULD_STREAM = (
             True if self.AZURE_OPENAI_STREAM.lower() == "true" else False
         )
@@ -109,6 +109,12 @@ class LLMHelper:
             .embedding
         )
 
+    def generate_embeddings_batch(self, inputs: List[str]) -> List[List[float]]:
+        response = self.openai_client.embeddings.create(
+            input=inputs, model=self.embedding_model
+        )
+        return [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+
     def get_chat_completion_with_functions(
         self, messages: list[dict], functions: list[dict], function_call: str = "auto"
     ):
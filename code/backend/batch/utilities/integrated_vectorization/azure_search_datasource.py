@@ -5,23 +5,14 @@ from azure.search.documents.indexes.models import (
 from azure.search.documents.indexes._generated.models import (
     NativeBlobSoftDeleteDeletionDetectionPolicy,
 )
-from azure.search.documents.indexes import SearchIndexerClient
 from ..helpers.env_helper import EnvHelper
-from azure.identity import DefaultAzureCredential
-from azure.core.credentials import AzureKeyCredential
+from .search_clients import get_search_indexer_client
 
 
 class AzureSearchDatasource:
     def __init__(self, env_helper: EnvHelper):
         self.env_helper = env_helper
-        self.indexer_client = SearchIndexerClient(
-            self.env_helper.AZURE_SEARCH_SERVICE,
-            (
-                AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                if self.env_helper.is_auth_type_keys()
-                else DefaultAzureCredential()
-            ),
-        )
+        self.indexer_client = get_search_indexer_client(self.env_helper)
 
     def create_or_update_datasource(self):
         connection_string = self.generate_datasource_connection_string()
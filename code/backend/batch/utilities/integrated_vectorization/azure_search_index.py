@@ -1,5 +1,4 @@
 import logging
-from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     SearchField,
     SearchFieldDataType,
@@ -21,9 +20,8 @@ from azure.search.documents.indexes.models import (
     SearchIndex,
 )
 from ..helpers.env_helper import EnvHelper
-from azure.identity import DefaultAzureCredential
-from azure.core.credentials import AzureKeyCredential
 from ..helpers.llm_helper import LLMHelper
+from .search_clients import get_search_index_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,21 +32,20 @@ class AzureSearchIndex:
     def __init__(self, env_helper: EnvHelper, llm_helper: LLMHelper):
         self.env_helper = env_helper
         self.llm_helper = llm_helper
-        self.index_client = SearchIndexClient(
-            self.env_helper.AZURE_SEARCH_SERVICE,
-            (
-                AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                if self.env_helper.is_auth_type_keys()
-                else DefaultAzureCredential()
-            ),
-        )
+        self.index_client = get_search_index_client(self.env_helper)
 
     @property
     def search_dimensions(self) -> int:
         if AzureSearchIndex._search_dimension is None:
-            AzureSearchIndex._search_dimension = len(
-                self.llm_helper.get_embedding_model().embed_query("Text")
-            )
+            if self.env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS:
+                # Known up front, so skip probing the embedding deployment
+                AzureSearchIndex._search_dimension = int(
+                    self.env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS
+                )
+            else:
+                AzureSearchIndex._search_dimension = len(
+                    self.llm_helper.get_embedding_model().embed_query("Text")
+                )
         return AzureSearchIndex._search_dimension
 
     def create_or_update_index(self):
@@ -70,7 +67,11 @@ class AzureSearchIndex:
                 name="content_vector",
                 type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
                 vector_search_dimensions=self.search_dimensions,
-                vector_search_profile_name="myHnswProfile",
+                vector_search_profile_name=(
+                    "myExhaustiveKnnProfile"
+                    if self.env_helper.AZURE_SEARCH_USE_EXHAUSTIVE_KNN
+                    else "myHnswProfile"
+                ),
             ),
             SearchableField(name="metadata", type=SearchFieldDataType.String),
             SearchableField(
@@ -128,12 +129,13 @@ class AzureSearchIndex:
 
         return VectorSearch(
             algorithms=[
+                # HNSW graph parameters are tunable through the environment
                 HnswAlgorithmConfiguration(
                     name="myHnsw",
                     parameters=HnswParameters(
-                        m=4,
-                        ef_construction=400,
-                        ef_search=500,
+                        m=self.env_helper.AZURE_SEARCH_HNSW_M,
+                        ef_construction=self.env_helper.AZURE_SEARCH_HNSW_EF_CONSTRUCTION,
+                        ef_search=self.env_helper.AZURE_SEARCH_HNSW_EF_SEARCH,
                         metric=VectorSearchAlgorithmMetric.COSINE,
                     ),
                 ),
@@ -1,24 +1,42 @@
 import logging
-from azure.search.documents.indexes.models import SearchIndexer, FieldMapping
-from azure.search.documents.indexes import SearchIndexerClient
+import time
+from typing import Dict, Tuple
+from azure.core.exceptions import ResourceNotFoundError
+from azure.search.documents.indexes.models import (
+    SearchIndexer,
+    FieldMapping,
+    IndexingParameters,
+)
 from ..helpers.env_helper import EnvHelper
-from azure.identity import DefaultAzureCredential
-from azure.core.credentials import AzureKeyCredential
+from .definition_cache import (
+    get_applied_result,
+    get_definition_hash,
+    set_applied_result,
+)
+from .search_clients import get_search_indexer_client
 
 logger = logging.getLogger(__name__)
 
+INDEXER_EXISTS_CACHE_TTL_SECONDS = 60
+
+# (search service, indexer name) -> (expiry time, whether the indexer exists)
+_indexer_exists_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
+# The mappings do not depend on the deployment, so they are only built once
+_FIELD_MAPPINGS = tuple(
+    FieldMapping(source_field_name=source, target_field_name=target)
+    for source, target in (
+        ("metadata_storage_path", "source"),
+        ("/document/normalized_images/*/text", "text"),
+        ("/document/normalized_images/*/layoutText", "layoutText"),
+    )
+)
+
 
 class AzureSearchIndexer:
     def __init__(self, env_helper: EnvHelper):
         self.env_helper = env_helper
-        self.indexer_client = SearchIndexerClient(
-            self.env_helper.AZURE_SEARCH_SERVICE,
-            (
-                AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                if self.env_helper.is_auth_type_keys()
-                else DefaultAzureCredential()
-            ),
-        )
+        self.indexer_client = get_search_indexer_client(self.env_helper)
 
     def create_or_update_indexer(self, indexer_name: str, skillset_name: str):
         indexer = SearchIndexer(
@@ -27,44 +45,57 @@ class AzureSearchIndexer:
             skillset_name=skillset_name,
             target_index_name=self.env_helper.AZURE_SEARCH_INDEX,
             data_source_name=self.env_helper.AZURE_SEARCH_DATASOURCE_NAME,
-            parameters={
-                "configuration": {
-                    "dataToExtract": "contentAndMetadata",
-                    "parsingMode": "default",
-                    "imageAction": "generateNormalizedImages",
+            # from_dict keeps the request body to the values set here, where the
+            # model's constructor would also send every configuration default
+            parameters=IndexingParameters.from_dict(
+                {
+                    "configuration": {
+                        "dataToExtract": "contentAndMetadata",
+                        "parsingMode": "default",
+                        "imageAction": "generateNormalizedImages",
+                    }
                 }
-            },
-            field_mappings=[
-                FieldMapping(
-                    source_field_name="metadata_storage_path",
-                    target_field_name="source",
-                ),
-                FieldMapping(
-                    source_field_name="/document/normalized_images/*/text",
-                    target_field_name="text",
-                ),
-                FieldMapping(
-                    source_field_name="/document/normalized_images/*/layoutText",
-                    target_field_name="layoutText",
-                ),
-            ],
+            ),
+            field_mappings=list(_FIELD_MAPPINGS),
         )
-        indexer_result = self.indexer_client.create_or_update_indexer(indexer)
-        # Run the indexer
-        self.indexer_client.run_indexer(indexer_name)
-        logger.info(
-            f" {indexer_name} is created and running. If queries return no results, please wait a bit and try again."
+        # Skip the PUT when this process already applied the same definition
+        indexer_hash = get_definition_hash(indexer)
+        search_service = self.env_helper.AZURE_SEARCH_SERVICE
+        indexer_result = get_applied_result(
+            search_service, "indexer", indexer_name, indexer_hash
         )
+        if indexer_result is None:
+            indexer_result = self.indexer_client.create_or_update_indexer(indexer)
+            set_applied_result(
+                search_service, "indexer", indexer_name, indexer_hash, indexer_result
+            )
+            _indexer_exists_cache.pop((search_service, indexer_name), None)
+        # Run the indexer
+        self.run_indexer(indexer_name)
         return indexer_result
 
-    def run_indexer(self, indexer_name: str):
-        self.indexer_client.reset_indexer(indexer_name)
+    def run_indexer(self, indexer_name: str, force_reset: bool = False):
+        # Resetting makes the next run re-process every document, so only do it
+        # when a full rebuild is wanted
+        if force_reset:
+            self.indexer_client.reset_indexer(indexer_name)
         self.indexer_client.run_indexer(indexer_name)
         logger.info(
             f" {indexer_name} is created and running. If queries return no results, please wait a bit and try again."
         )
 
     def indexer_exists(self, indexer_name: str):
-        return indexer_name in [
-            name for name in self.indexer_client.get_indexer_names()
-        ]
+        cache_key = (self.env_helper.AZURE_SEARCH_SERVICE, indexer_name)
+        expiry, exists = _indexer_exists_cache.get(cache_key, (0.0, False))
+        if time.monotonic() >= expiry:
+            # Look up the one indexer rather than listing every indexer in the service
+            try:
+                self.indexer_client.get_indexer(indexer_name)
+                exists = True
+            except ResourceNotFoundError:
+                exists = False
+            _indexer_exists_cache[cache_key] = (
+                time.monotonic() + INDEXER_EXISTS_CACHE_TTL_SECONDS,
+                exists,
+            )
+        return exists
@@ -12,14 +12,74 @@ from azure.search.documents.indexes.models import (
     IndexProjectionMode,
     SearchIndexerSkillset,
 )
-from azure.search.documents.indexes import SearchIndexerClient
 from ..helpers.config.config_helper import IntegratedVectorizationConfig
 from ..helpers.env_helper import EnvHelper
-from azure.identity import DefaultAzureCredential
-from azure.core.credentials import AzureKeyCredential
+from .definition_cache import (
+    get_applied_result,
+    get_definition_hash,
+    set_applied_result,
+)
+from .search_clients import get_search_indexer_client
 
 logger = logging.getLogger(__name__)
 
+# Overlaps of 10-20% of the page keep sentences split across page boundaries
+# retrievable, and fixing a smaller one means re-embedding every document
+MIN_PAGE_OVERLAP_RATIO = 0.10
+
+# The OCR and merge skills do not depend on the deployment, so build them once
+_OCR_SKILL = OcrSkill(
+    description="Extract text (plain and structured) from image",
+    context="/document/normalized_images/*",
+    inputs=[
+        InputFieldMappingEntry(
+            name="image",
+            source="/document/normalized_images/*",
+        )
+    ],
+    outputs=[
+        OutputFieldMappingEntry(name="text", target_name="text"),
+        OutputFieldMappingEntry(name="layoutText", target_name="layoutText"),
+    ],
+)
+
+_MERGE_SKILL = MergeSkill(
+    description="Merge text from OCR and text from document",
+    context="/document",
+    inputs=[
+        InputFieldMappingEntry(name="text", source="/document/content"),
+        InputFieldMappingEntry(
+            name="itemsToInsert", source="/document/normalized_images/*/text"
+        ),
+        InputFieldMappingEntry(
+            name="offsets", source="/document/normalized_images/*/contentOffset"
+        ),
+    ],
+    outputs=[OutputFieldMappingEntry(name="mergedText", target_name="merged_content")],
+)
+
+# Field mappings of the skills built per call, which never change
+_SPLIT_INPUTS = (
+    InputFieldMappingEntry(name="text", source="/document/merged_content"),
+)
+_SPLIT_OUTPUTS = (OutputFieldMappingEntry(name="textItems", target_name="pages"),)
+_EMBEDDING_INPUTS = (InputFieldMappingEntry(name="text", source="/document/pages/*"),)
+_EMBEDDING_OUTPUTS = (
+    OutputFieldMappingEntry(name="embedding", target_name="content_vector"),
+)
+
+# Index field -> enrichment tree source projected into it for each page
+_INDEX_PROJECTION_MAPPINGS = {
+    "content": "/document/pages/*",
+    "content_vector": "/document/pages/*/content_vector",
+    "title": "/document/title",
+    "source": "/document/metadata_storage_path",
+}
+_INDEX_PROJECTION_MAPPING_ENTRIES = tuple(
+    InputFieldMappingEntry(name=name, source=source)
+    for name, source in _INDEX_PROJECTION_MAPPINGS.items()
+)
+
 
 class AzureSearchSkillset:
     def __init__(
@@ -28,50 +88,14 @@ class AzureSearchSkillset:
         integrated_vectorization_config: IntegratedVectorizationConfig,
     ):
         self.env_helper = env_helper
-        self.indexer_client = SearchIndexerClient(
-            self.env_helper.AZURE_SEARCH_SERVICE,
-            (
-                AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                if self.env_helper.is_auth_type_keys()
-                else DefaultAzureCredential()
-            ),
-        )
+        self.indexer_client = get_search_indexer_client(self.env_helper)
         self.integrated_vectorization_config = integrated_vectorization_config
+        # The embedding skill only depends on the environment, so resolve it once
+        self.embedding_skill = self._build_embedding_skill()
 
     def create_skillset(self):
         skillset_name = f"{self.env_helper.AZURE_SEARCH_INDEX}-skillset"
-
-        ocr_skill = OcrSkill(
-            description="Extract text (plain and structured) from image",
-            context="/document/normalized_images/*",
-            inputs=[
-                InputFieldMappingEntry(
-                    name="image",
-                    source="/document/normalized_images/*",
-                )
-            ],
-            outputs=[
-                OutputFieldMappingEntry(name="text", target_name="text"),
-                OutputFieldMappingEntry(name="layoutText", target_name="layoutText"),
-            ],
-        )
-
-        merge_skill = MergeSkill(
-            description="Merge text from OCR and text from document",
-            context="/document",
-            inputs=[
-                InputFieldMappingEntry(name="text", source="/document/content"),
-                InputFieldMappingEntry(
-                    name="itemsToInsert", source="/document/normalized_images/*/text"
-                ),
-                InputFieldMappingEntry(
-                    name="offsets", source="/document/normalized_images/*/contentOffset"
-                ),
-            ],
-            outputs=[
-                OutputFieldMappingEntry(name="mergedText", target_name="merged_content")
-            ],
-        )
+        self._warn_if_page_overlap_too_small()
 
         split_skill = SplitSkill(
             description="Split skill to chunk documents",
@@ -79,28 +103,8 @@ class AzureSearchSkillset:
             context="/document",
             maximum_page_length=self.integrated_vectorization_config.max_page_length,
             page_overlap_length=self.integrated_vectorization_config.page_overlap_length,
-            inputs=[
-                InputFieldMappingEntry(name="text", source="/document/merged_content"),
-            ],
-            outputs=[OutputFieldMappingEntry(name="textItems", target_name="pages")],
-        )
-
-        embedding_skill = AzureOpenAIEmbeddingSkill(
-            description="Skill to generate embeddings via Azure OpenAI",
-            context="/document/pages/*",
-            resource_uri=self.env_helper.AZURE_OPENAI_ENDPOINT,
-            deployment_id=self.env_helper.AZURE_OPENAI_EMBEDDING_MODEL,
-            api_key=(
-                self.env_helper.OPENAI_API_KEY
-                if self.env_helper.is_auth_type_keys()
-                else None
-            ),
-            inputs=[
-                InputFieldMappingEntry(name="text", source="/document/pages/*"),
-            ],
-            outputs=[
-                OutputFieldMappingEntry(name="embedding", target_name="content_vector")
-            ],
+            inputs=list(_SPLIT_INPUTS),
+            outputs=list(_SPLIT_OUTPUTS),
         )
 
         index_projections = SearchIndexerIndexProjections(
@@ -109,19 +113,7 @@ class AzureSearchSkillset:
                     target_index_name=self.env_helper.AZURE_SEARCH_INDEX,
                     parent_key_field_name="id",
                     source_context="/document/pages/*",
-                    mappings=[
-                        InputFieldMappingEntry(
-                            name="content", source="/document/pages/*"
-                        ),
-                        InputFieldMappingEntry(
-                            name="content_vector",
-                            source="/document/pages/*/content_vector",
-                        ),
-                        InputFieldMappingEntry(name="title", source="/document/title"),
-                        InputFieldMappingEntry(
-                            name="source", source="/document/metadata_storage_path"
-                        ),
-                    ],
+                    mappings=list(_INDEX_PROJECTION_MAPPING_ENTRIES),
                 ),
             ],
             parameters=SearchIndexerIndexProjectionsParameters(
@@ -132,10 +124,53 @@ class AzureSearchSkillset:
         skillset = SearchIndexerSkillset(
             name=skillset_name,
             description="Skillset to chunk documents and generating embeddings",
-            skills=[ocr_skill, merge_skill, split_skill, embedding_skill],
+            skills=[_OCR_SKILL, _MERGE_SKILL, split_skill, self.embedding_skill],
             index_projections=index_projections,
         )
 
-        skillset_result = self.indexer_client.create_or_update_skillset(skillset)
-        logger.info(f"{skillset.name} created")
+        # Skip the PUT when this process already applied the same definition
+        skillset_hash = get_definition_hash(skillset)
+        search_service = self.env_helper.AZURE_SEARCH_SERVICE
+        skillset_result = get_applied_result(
+            search_service, "skillset", skillset_name, skillset_hash
+        )
+        if skillset_result is None:
+            skillset_result = self.indexer_client.create_or_update_skillset(skillset)
+            set_applied_result(
+                search_service,
+                "skillset",
+                skillset_name,
+                skillset_hash,
+                skillset_result,
+            )
+            logger.info(f"{skillset.name} created")
         return skillset_result
+
+    def _build_embedding_skill(self) -> AzureOpenAIEmbeddingSkill:
+        return AzureOpenAIEmbeddingSkill(
+            description="Skill to generate embeddings via Azure OpenAI",
+            context="/document/pages/*",
+            resource_uri=self.env_helper.AZURE_OPENAI_ENDPOINT,
+            deployment_id=self.env_helper.AZURE_OPENAI_EMBEDDING_MODEL,
+            api_key=(
+                self.env_helper.OPENAI_API_KEY
+                if self.env_helper.is_auth_type_keys()
+                else None
+            ),
+            inputs=list(_EMBEDDING_INPUTS),
+            outputs=list(_EMBEDDING_OUTPUTS),
+        )
+
+    def _warn_if_page_overlap_too_small(self):
+        try:
+            max_page_length = int(self.integrated_vectorization_config.max_page_length)
+            page_overlap_length = int(
+                self.integrated_vectorization_config.page_overlap_length
+            )
+        except (TypeError, ValueError):
+            # Invalid lengths are rejected by the search service itself
+            return
+        if page_overlap_length < max_page_length * MIN_PAGE_OVERLAP_RATIO:
+            logger.warning(
+                f"Page overlap length {page_overlap_length} is less than {MIN_PAGE_OVERLAP_RATIO:.0%} of the max page length {max_page_length}, content split across pages may not be retrieved."
+            )
@@ -0,0 +1,45 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Tuple
+
+APPLIED_DEFINITION_CACHE_TTL_SECONDS = 60
+
+# (search service, resource kind, resource name) ->
+# (expiry time, definition hash, result of the last PUT)
+_applied_definitions: Dict[Tuple[str, str, str], Tuple[float, str, Any]] = {}
+
+
+def get_definition_hash(definition) -> str:
+    return hashlib.sha256(
+        json.dumps(definition.as_dict(), sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def get_applied_result(
+    search_service: str, kind: str, name: str, definition_hash: str
+) -> Any | None:
+    """
+    Return the result of the last create or update of the resource, if it was made
+    by this process with an identical definition within the cache TTL.
+    """
+    expiry, applied_hash, result = _applied_definitions.get(
+        (search_service, kind, name), (0.0, None, None)
+    )
+    if time.monotonic() >= expiry or applied_hash != definition_hash:
+        return None
+    return result
+
+
+def set_applied_result(
+    search_service: str, kind: str, name: str, definition_hash: str, result: Any
+):
+    _applied_definitions[(search_service, kind, name)] = (
+        time.monotonic() + APPLIED_DEFINITION_CACHE_TTL_SECONDS,
+        definition_hash,
+        result,
+    )
+
+
+def clear_applied_results():
+    _applied_definitions.clear()
@@ -0,0 +1,66 @@
+from functools import lru_cache
+from azure.search.documents.indexes import SearchIndexClient, SearchIndexerClient
+from ..helpers.env_helper import EnvHelper
+from azure.identity import DefaultAzureCredential
+from azure.core.credentials import AzureKeyCredential
+
+
+@lru_cache(maxsize=1)
+def _get_default_credential() -> DefaultAzureCredential:
+    # Building the credential chain probes every provider, so do it once per process
+    return DefaultAzureCredential()
+
+
+@lru_cache(maxsize=1)
+def _get_key_credential(search_key: str) -> AzureKeyCredential:
+    return AzureKeyCredential(search_key)
+
+
+def _get_credential(use_keys_auth: bool, search_key: str | None):
+    if use_keys_auth:
+        return _get_key_credential(search_key)
+    return _get_default_credential()
+
+
+@lru_cache(maxsize=1)
+def _create_search_index_client(
+    search_service: str, use_keys_auth: bool, search_key: str | None
+) -> SearchIndexClient:
+    return SearchIndexClient(search_service, _get_credential(use_keys_auth, search_key))
+
+
+@lru_cache(maxsize=1)
+def _create_search_indexer_client(
+    search_service: str, use_keys_auth: bool, search_key: str | None
+) -> SearchIndexerClient:
+    return SearchIndexerClient(
+        search_service, _get_credential(use_keys_auth, search_key)
+    )
+
+
+def _get_search_key(env_helper: EnvHelper) -> str | None:
+    if not env_helper.is_auth_type_keys():
+        return None
+    if not env_helper.AZURE_SEARCH_KEY:
+        raise Exception("AZURE_SEARCH_KEY must be set when AZURE_AUTH_TYPE is keys")
+    return env_helper.AZURE_SEARCH_KEY
+
+
+def get_search_credential(env_helper: EnvHelper):
+    return _get_credential(env_helper.is_auth_type_keys(), _get_search_key(env_helper))
+
+
+def get_search_index_client(env_helper: EnvHelper) -> SearchIndexClient:
+    return _create_search_index_client(
+        env_helper.AZURE_SEARCH_SERVICE,
+        env_helper.is_auth_type_keys(),
+        _get_search_key(env_helper),
+    )
+
+
+def get_search_indexer_client(env_helper: EnvHelper) -> SearchIndexerClient:
+    return _create_search_indexer_client(
+        env_helper.AZURE_SEARCH_SERVICE,
+        env_helper.is_auth_type_keys(),
+        _get_search_key(env_helper),
+    )
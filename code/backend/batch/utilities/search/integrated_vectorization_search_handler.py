@@ -1,11 +1,12 @@
 from typing import List
 from .search_handler_base import SearchHandlerBase
 from azure.search.documents import SearchClient
-from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.models import VectorizableTextQuery
-from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential
 from ..common.source_document import SourceDocument
+from ..integrated_vectorization.search_clients import (
+    get_search_credential,
+    get_search_index_client,
+)
 import re
 
 
@@ -15,11 +16,7 @@ class IntegratedVectorizationSearchHandler(SearchHandlerBase):
             return SearchClient(
                 endpoint=self.env_helper.AZURE_SEARCH_SERVICE,
                 index_name=self.env_helper.AZURE_SEARCH_INDEX,
-                credential=(
-                    AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                    if self.env_helper.is_auth_type_keys()
-                    else DefaultAzureCredential()
-                ),
+                credential=get_search_credential(self.env_helper),
             )
 
     def perform_search(self, filename):
@@ -142,14 +139,7 @@ class IntegratedVectorizationSearchHandler(SearchHandlerBase):
         return source_url
 
     def _check_index_exists(self) -> bool:
-        search_index_client = SearchIndexClient(
-            endpoint=self.env_helper.AZURE_SEARCH_SERVICE,
-            credential=(
-                AzureKeyCredential(self.env_helper.AZURE_SEARCH_KEY)
-                if self.env_helper.is_auth_type_keys()
-                else DefaultAzureCredential()
-            ),
-        )
+        search_index_client = get_search_index_client(self.env_helper)
 
         return self.env_helper.AZURE_SEARCH_INDEX in [
             name for name in search_index_client.list_index_names()
@@ -1,11 +1,8 @@
 import hashlib
+import pytest
 from unittest.mock import patch
 from urllib.parse import urlparse
-from backend.batch.utilities.common.source_document import (
-    SourceDocument,
-    SourceDocumentDecoder,
-    SourceDocumentEncoder,
-)
+from backend.batch.utilities.common.source_document import SourceDocument
 
 
 def test_get_filename():
@@ -144,7 +141,7 @@ def test_from_metadata():
     assert source_document.page_number == expected_source_document.page_number
 
 
-def test_default_method_returns_expected_dict():
+def test_to_dict_returns_expected_dict():
     # Given
     source_document = SourceDocument(
         id="1",
@@ -158,10 +155,7 @@ def test_default_method_returns_expected_dict():
     )
 
     # When
-    result = SourceDocumentEncoder().default(source_document)
-
-    # Then
-    assert isinstance(result, dict)
+    result = source_document.to_dict()
 
     # Then
     expected_dict = {
@@ -177,50 +171,54 @@ def test_default_method_returns_expected_dict():
     assert result == expected_dict
 
 
-def test_default_method_calls_super_default():
+def test_from_json_returns_expected_source_document():
     # Given
-    source_document = SourceDocument(
+    obj = '{"id": "1","content": "Some content","source": "A source","title": "A title","chunk": "A chunk","offset": "An offset","page_number": "1", "chunk_id": "abcd"}'
+
+    # When
+    result = SourceDocument.from_json(obj)
+
+    # Then
+    expected_source_document = SourceDocument(
         id="1",
         content="Some content",
-        title="A title",
         source="A source",
+        title="A title",
         chunk="A chunk",
         offset="An offset",
         page_number="1",
+        chunk_id="abcd",
+    )
+    assert result == expected_source_document
+
+
+def test_to_json_round_trips():
+    # Given
+    source_document = SourceDocument(
+        id="1",
+        content="Some content",
+        title="A title",
+        source="A source",
+        chunk=0,
+        offset=10,
+        page_number=1,
+        chunk_id="abcd",
     )
 
     # When
-    with patch.object(SourceDocumentEncoder, "default") as super_default_mock:
-        SourceDocumentEncoder.default(source_document)
+    result = SourceDocument.from_json(source_document.to_json())
 
     # Then
-    super_default_mock.assert_called_once_with(source_document)
+    assert result == source_document
 
 
-def test_decode_method_returns_expected_source_document():
+def test_source_document_does_not_allow_unknown_attributes():
     # Given
-    obj = '{"id": "1","content": "Some content","source": "A source","title": "A title","chunk": "A chunk","offset": "An offset","page_number": "1", "chunk_id": "abcd"}'
+    source_document = SourceDocument(content="Some content", source="A source")
 
     # When
-    result = SourceDocumentDecoder().decode(obj)
+    with pytest.raises(AttributeError):
+        source_document.unknown = "value"
 
     # Then
-    assert isinstance(result, SourceDocument)
-
-    expected_source_document = SourceDocument(
-        id="1",
-        content="Some content",
-        source="A source",
-        title="A title",
-        chunk="A chunk",
-        offset="An offset",
-        page_number="1",
-        chunk_id="abcd",
-    )
-    assert result.id == expected_source_document.id
-    assert result.content == expected_source_document.content
-    assert result.source == expected_source_document.source
-    assert result.title == expected_source_document.title
-    assert result.chunk == expected_source_document.chunk
-    assert result.offset == expected_source_document.offset
-    assert result.page_number == expected_source_document.page_number
+    assert not hasattr(source_document, "__dict__")
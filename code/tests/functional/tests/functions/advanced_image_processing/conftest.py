@@ -1,15 +1,11 @@
 import logging
-import os
-import sys
 import pytest
 from tests.functional.app_config import AppConfig
 
-sys.path.append(
-    os.path.join(os.path.dirname(sys.path[0]), "..", "..", "..", "backend", "batch")
-)
-# The below imports are needed due to the sys.path.append above as the backend function is not aware of the folders outside of the function
-from utilities.helpers.config.config_helper import ConfigHelper  # noqa: E402
-from utilities.helpers.env_helper import EnvHelper  # noqa: E402
+# The backend function imports utilities as a top-level package (see pythonpath in
+# pytest.ini), so these are the instances it uses, not the backend.batch ones
+from utilities.helpers.config.config_helper import ConfigHelper
+from utilities.helpers.env_helper import EnvHelper
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +13,21 @@ from tests.constants import (
     COMPUTER_VISION_VECTORIZE_IMAGE_PATH,
     COMPUTER_VISION_VECTORIZE_IMAGE_REQUEST_METHOD,
 )
-from backend.batch.batch_push_results import batch_push_results
 
 pytestmark = pytest.mark.functional
 
 FILE_NAME = "image.jpg"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def user_function():
+    # Imported here so collecting this module does not load the whole function app
+    from backend.batch.batch_push_results import batch_push_results
+
+    return batch_push_results.build().get_user_function()
+
+
+@pytest.fixture(scope="module")
 def message(app_config: AppConfig):
     return QueueMessage(
         body=json.dumps(
@@ -95,10 +102,13 @@ def setup_caption_response(httpserver: HTTPServer, app_config: AppConfig):
 
 
 def test_config_file_is_retrieved_from_storage(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     verify_request_made(
@@ -115,10 +125,13 @@ def test_config_file_is_retrieved_from_storage(
 
 
 def test_image_passed_to_computer_vision_to_generate_image_embeddings(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     request = verify_request_made(
@@ -146,10 +159,13 @@ def test_image_passed_to_computer_vision_to_generate_image_embeddings(
 
 
 def test_image_passed_to_llm_to_generate_caption(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     request = verify_request_made(
@@ -200,10 +216,13 @@ If the image is mostly text, use OCR to extract the text as it is displayed in t
 
 
 def test_embeddings_generated_for_caption(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     verify_request_made(
@@ -229,10 +248,13 @@ def test_embeddings_generated_for_caption(
 
 
 def test_metadata_is_updated_after_processing(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     verify_request_made(
@@ -254,10 +276,13 @@ def test_metadata_is_updated_after_processing(
 
 
 def test_makes_correct_call_to_list_search_indexes(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     verify_request_made(
@@ -276,10 +301,13 @@ def test_makes_correct_call_to_list_search_indexes(
 
 
 def test_makes_correct_call_to_create_documents_search_index(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     verify_request_made(
@@ -425,10 +453,13 @@ def test_makes_correct_call_to_create_documents_search_index(
 
 
 def test_makes_correct_call_to_store_documents_in_search_index(
-    message: QueueMessage, httpserver: HTTPServer, app_config: AppConfig
+    user_function,
+    message: QueueMessage,
+    httpserver: HTTPServer,
+    app_config: AppConfig,
 ):
     # when
-    batch_push_results.build().get_user_function()(message)
+    user_function(message)
 
     # then
     expected_file_path = f"{app_config.get('AZURE_BLOB_CONTAINER_NAME')}/{FILE_NAME}"
@@ -1,16 +1,15 @@
 import logging
-import os
-import sys
 import pytest
 
 from tests.functional.app_config import AppConfig
 
-sys.path.append(
-    os.path.join(os.path.dirname(sys.path[0]), "..", "..", "..", "backend", "batch")
+# The backend function imports utilities as a top-level package (see pythonpath in
+# pytest.ini), so these are the instances it uses, not the backend.batch ones
+from utilities.helpers.config.config_helper import ConfigHelper
+from utilities.helpers.env_helper import EnvHelper
+from utilities.integrated_vectorization.definition_cache import (
+    clear_applied_results,
 )
-# The below imports are needed due to the sys.path.append above as the backend function is not aware of the folders outside of the function
-from utilities.helpers.config.config_helper import ConfigHelper  # noqa: E402
-from utilities.helpers.env_helper import EnvHelper  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -44,3 +43,9 @@ def manage_app(app_config: AppConfig):
     app_config.remove_from_environment()
     EnvHelper.clear_instance()
     ConfigHelper.clear_config()
+
+
+@pytest.fixture(autouse=True)
+def clear_applied_search_definitions():
+    # Each test expects the search resources to be PUT again
+    clear_applied_results()
@@ -1,12 +1,6 @@
-import sys
-import os
 from unittest.mock import ANY, MagicMock, patch
 import azure.functions as func
-
-
-sys.path.append(os.path.join(os.path.dirname(sys.path[0]), "backend", "batch"))
-
-from backend.batch.add_url_embeddings import add_url_embeddings  # noqa: E402
+from backend.batch.add_url_embeddings import add_url_embeddings
 
 
 @patch("backend.batch.add_url_embeddings.EmbedderFactory")
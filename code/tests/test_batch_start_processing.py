@@ -45,8 +45,13 @@ def test_batch_start_processing_processes_all(
 
     send_message_calls = mock_queue_client.send_message.call_args_list
     assert len(send_message_calls) == 2
-    assert send_message_calls[0] == call(b'{"filename": "file_name_one"}')
-    assert send_message_calls[1] == call(b'{"filename": "file_name_two"}')
+    mock_queue_client.send_message.assert_has_calls(
+        [
+            call(b'{"filename": "file_name_one"}'),
+            call(b'{"filename": "file_name_two"}'),
+        ],
+        any_order=True,
+    )
 
 
 @patch("backend.batch.batch_start_processing.create_queue_client")
@@ -121,6 +121,23 @@ def test_process_using_integrated_vectorization(
     )
 
 
+def test_process_using_integrated_vectorization_raises_datasource_error(
+    env_helper_mock: MagicMock,
+    azure_search_iv_datasource_helper_mock: MagicMock,
+    azure_search_iv_indexer_helper_mock: MagicMock,
+):
+    # given
+    document_processor = IntegratedVectorizationEmbedder(env_helper_mock)
+    azure_search_iv_datasource_helper_mock.return_value.create_or_update_datasource.side_effect = Exception(
+        "Datasource error"
+    )
+
+    # when + then
+    with pytest.raises(Exception, match="Datasource error"):
+        document_processor.process_using_integrated_vectorization("some-url")
+    azure_search_iv_indexer_helper_mock.return_value.create_or_update_indexer.assert_not_called()
+
+
 def test_reprocess_all_runs_indexer_when_indexer_exists(
     env_helper_mock: MagicMock,
     llm_helper_mock: MagicMock,
@@ -140,7 +157,7 @@ def test_reprocess_all_runs_indexer_when_indexer_exists(
 
     # Then
     azure_search_iv_indexer_helper_mock.return_value.run_indexer.assert_called_once_with(
-        env_helper_mock.AZURE_SEARCH_INDEXER_NAME
+        env_helper_mock.AZURE_SEARCH_INDEXER_NAME, force_reset=True
     )
     azure_search_iv_indexer_helper_mock.return_value.create_or_update_indexer.assert_not_called()
 
@@ -70,6 +70,7 @@ def env_helper_mock():
         )
 
         env_helper.USE_ADVANCED_IMAGE_PROCESSING = USE_ADVANCED_IMAGE_PROCESSING
+        env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS = ""
         env_helper.is_auth_type_keys.return_value = True
 
         yield env_helper
@@ -303,6 +304,26 @@ def test_creates_search_index_with_image_embeddings_when_advanced_image_processi
     )
 
 
+@patch("backend.batch.utilities.helpers.azure_search_helper.SearchClient")
+@patch("backend.batch.utilities.helpers.azure_search_helper.SearchIndexClient")
+def test_search_dimensions_uses_configured_dimensions(
+    search_index_client_mock: MagicMock,
+    search_client_mock: MagicMock,
+    env_helper_mock: MagicMock,
+    llm_helper_mock: MagicMock,
+):
+    # given
+    env_helper_mock.AZURE_OPENAI_EMBEDDING_DIMENSIONS = "3072"
+    azure_search_helper = AzureSearchHelper()
+
+    # when
+    search_dimensions = azure_search_helper.search_dimensions
+
+    # then
+    assert search_dimensions == 3072
+    llm_helper_mock.get_embedding_model.return_value.embed_query.assert_not_called()
+
+
 @patch("backend.batch.utilities.helpers.azure_search_helper.SearchClient")
 @patch("backend.batch.utilities.helpers.azure_search_helper.SearchIndexClient")
 def test_does_not_create_search_index_if_it_exists(
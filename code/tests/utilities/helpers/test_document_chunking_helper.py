@@ -1,9 +1,12 @@
+from unittest.mock import MagicMock, patch
 from backend.batch.utilities.common.source_document import SourceDocument
 from backend.batch.utilities.helpers.document_chunking_helper import DocumentChunking
 from backend.batch.utilities.document_chunking.chunking_strategy import (
     ChunkingStrategy,
     ChunkingSettings,
 )
+from backend.batch.utilities.document_chunking import document_chunking_base
+from backend.batch.utilities.document_chunking.layout import LayoutDocumentChunking
 
 # Create a sample document
 documents = [
@@ -109,3 +112,47 @@ def test_document_chunking_fixed_size_overlap():
         chunked_documents[6].content
         == " shows how the different chunking strategies work now!"
     )
+
+
+def test_document_chunking_offsets_point_to_chunk_content():
+    # Test overlapping chunks report their position in the full document
+    full_document_content = "".join(document.content for document in documents)
+    for strategy in [ChunkingStrategy.LAYOUT, ChunkingStrategy.FIXED_SIZE_OVERLAP]:
+        chunking = ChunkingSettings({"strategy": strategy, "size": 10, "overlap": 5})
+        document_chunking = DocumentChunking()
+        chunked_documents = document_chunking.chunk(documents, chunking)
+        assert chunked_documents[0].offset == 0
+        for chunked_document in chunked_documents:
+            start = chunked_document.offset
+            end = start + len(chunked_document.content)
+            assert full_document_content[start:end] == chunked_document.content
+
+
+@patch("backend.batch.utilities.document_chunking.document_chunking_base.logger")
+def test_document_chunking_offsets_fall_back_when_chunk_not_found(
+    logger_mock: MagicMock,
+):
+    # Test a chunk altered by a token split inside a multi-byte character
+    content = "Zürich café ☕ opens at 8"
+    chunks = ["Zürich café", "caf\ufffd", "☕ opens at 8"]
+
+    offsets = LayoutDocumentChunking()._get_chunk_offsets(content, chunks)
+
+    assert offsets == [0, len("Zürich café"), content.index("☕")]
+    logger_mock.warning.assert_called_once()
+
+
+def test_document_chunking_reuses_splitter_for_same_settings():
+    # Test the splitter is only built once per chunk size and overlap
+    document_chunking_base.get_text_splitter.cache_clear()
+    chunking = ChunkingSettings(
+        {"strategy": ChunkingStrategy.LAYOUT, "size": 10, "overlap": 5}
+    )
+    document_chunking = DocumentChunking()
+
+    document_chunking.chunk(documents, chunking)
+    document_chunking.chunk(documents, chunking)
+
+    cache_info = document_chunking_base.get_text_splitter.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
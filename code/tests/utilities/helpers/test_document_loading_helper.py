@@ -3,6 +3,7 @@ from backend.batch.utilities.helpers.document_loading_helper import (
     DocumentLoading,
     LoadingSettings,
 )
+from backend.batch.utilities.document_loading.strategies import get_document_loader
 
 
 @pytest.mark.azure("This test requires Azure Document Intelligence configured")
@@ -50,3 +51,14 @@ def test_document_loading_docx():
     assert len(data) == 1
     assert data[0].source == url
     print(data[0].content)
+
+
+def test_get_document_loader_reuses_loader_instances():
+    # Test the same loader is returned for repeated lookups of a strategy
+    assert get_document_loader("docx") is get_document_loader("docx")
+    assert get_document_loader("layout") is not get_document_loader("read")
+
+
+def test_get_document_loader_raises_for_unknown_strategy():
+    with pytest.raises(Exception, match="Unknown loader strategy: unknown"):
+        get_document_loader("unknown")
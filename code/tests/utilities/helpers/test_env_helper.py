@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from pytest import MonkeyPatch
 import pytest
 from backend.batch.utilities.helpers.env_helper import EnvHelper
@@ -15,6 +15,19 @@ def test_env_helper_is_singleton():
     assert EnvHelper() is EnvHelper()
 
 
+def test_env_helper_does_not_lock_once_created():
+    # given
+    env_helper = EnvHelper()
+
+    # when
+    with patch.object(EnvHelper, "_lock", MagicMock()) as lock_mock:
+        actual_env_helper = EnvHelper()
+
+    # then
+    assert actual_env_helper is env_helper
+    lock_mock.__enter__.assert_not_called()
+
+
 def test_openai_base_url_generates_url_based_on_resource_name_if_not_set(
     monkeypatch: MonkeyPatch,
 ):
@@ -139,6 +139,33 @@ def test_generate_embeddings_returns_embeddings(azure_openai_mock):
     assert actual_embeddings == expected_embeddings
 
 
+def test_generate_embeddings_batch_embeds_inputs_in_one_request(azure_openai_mock):
+    # given
+    llm_helper = LLMHelper()
+    azure_openai_mock.return_value.embeddings.create.return_value = (
+        CreateEmbeddingResponse(
+            data=[
+                Embedding(embedding=[4, 5, 6], index=1, object="embedding"),
+                Embedding(embedding=[1, 2, 3], index=0, object="embedding"),
+            ],
+            model="mock-model",
+            object="list",
+            usage={"prompt_tokens": 0, "total_tokens": 0},
+        )
+    )
+
+    # when
+    actual_embeddings = llm_helper.generate_embeddings_batch(
+        ["some input", "some other input"]
+    )
+
+    # then
+    azure_openai_mock.return_value.embeddings.create.assert_called_once_with(
+        input=["some input", "some other input"], model=AZURE_OPENAI_EMBEDDING_MODEL
+    )
+    assert actual_embeddings == [[1, 2, 3], [4, 5, 6]]
+
+
 @patch("backend.batch.utilities.helpers.llm_helper.DefaultAzureCredential")
 @patch("backend.batch.utilities.helpers.llm_helper.MLClient")
 def test_get_ml_client_initializes_with_expected_parameters(
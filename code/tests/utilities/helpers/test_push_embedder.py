@@ -2,7 +2,11 @@ import hashlib
 import json
 import pytest
 from unittest.mock import MagicMock, call, patch
-from backend.batch.utilities.helpers.embedders.push_embedder import PushEmbedder
+from backend.batch.utilities.helpers.embedders.push_embedder import (
+    EMBEDDING_BATCH_SIZE,
+    UPLOAD_BATCH_SIZE,
+    PushEmbedder,
+)
 from backend.batch.utilities.document_chunking.chunking_strategy import ChunkingSettings
 from backend.batch.utilities.document_loading import LoadingSettings
 from backend.batch.utilities.document_loading.strategies import LoadingStrategy
@@ -28,6 +32,9 @@ def llm_helper_mock():
         mock_completion.choices = [choice]
 
         llm_helper.generate_embeddings.return_value = [123]
+        llm_helper.generate_embeddings_batch.side_effect = lambda inputs: [
+            [123] for _ in inputs
+        ]
         yield llm_helper
 
 
@@ -313,11 +320,50 @@ def test_embed_file_generates_embeddings_for_documents(llm_helper_mock):
     )
 
     # then
-    llm_helper_mock.generate_embeddings.assert_has_calls(
-        [call("some content"), call("some other content")]
+    llm_helper_mock.generate_embeddings_batch.assert_called_once_with(
+        ["some content", "some other content"]
+    )
+
+
+def test_embed_file_generates_embeddings_in_batches(
+    document_chunking_mock, llm_helper_mock
+):
+    # given
+    push_embedder = PushEmbedder(MagicMock(), MagicMock())
+    document_chunking_mock.return_value.chunk.return_value = [
+        SourceDocument(content=f"content {i}", source="some source")
+        for i in range(EMBEDDING_BATCH_SIZE + 1)
+    ]
+
+    # when
+    push_embedder.embed_file(
+        "some-url",
+        "some-file-name.pdf",
+    )
+
+    # then
+    llm_helper_mock.generate_embeddings_batch.assert_has_calls(
+        [
+            call([f"content {i}" for i in range(EMBEDDING_BATCH_SIZE)]),
+            call([f"content {EMBEDDING_BATCH_SIZE}"]),
+        ]
     )
 
 
+def test_embed_file_raises_exception_when_embeddings_are_missing(llm_helper_mock):
+    # given
+    push_embedder = PushEmbedder(MagicMock(), MagicMock())
+    llm_helper_mock.generate_embeddings_batch.side_effect = None
+    llm_helper_mock.generate_embeddings_batch.return_value = [[123]]
+
+    # when + then
+    with pytest.raises(ValueError):
+        push_embedder.embed_file(
+            "some-url",
+            "some-file-name.pdf",
+        )
+
+
 def test_embed_file_stores_documents_in_search_index(
     document_chunking_mock,
     llm_helper_mock,
@@ -339,7 +385,7 @@ def test_embed_file_stores_documents_in_search_index(
             {
                 "id": expected_chunked_documents[0].id,
                 "content": expected_chunked_documents[0].content,
-                "content_vector": llm_helper_mock.generate_embeddings.return_value,
+                "content_vector": [123],
                 "metadata": json.dumps(
                     {
                         "id": expected_chunked_documents[0].id,
@@ -359,7 +405,7 @@ def test_embed_file_stores_documents_in_search_index(
             {
                 "id": expected_chunked_documents[1].id,
                 "content": expected_chunked_documents[1].content,
-                "content_vector": llm_helper_mock.generate_embeddings.return_value,
+                "content_vector": [123],
                 "metadata": json.dumps(
                     {
                         "id": expected_chunked_documents[1].id,
@@ -380,6 +426,32 @@ def test_embed_file_stores_documents_in_search_index(
     )
 
 
+def test_embed_file_uploads_documents_in_batches(
+    document_chunking_mock,
+    azure_search_helper_mock: MagicMock,
+):
+    # given
+    push_embedder = PushEmbedder(MagicMock(), MagicMock())
+    document_chunking_mock.return_value.chunk.return_value = [
+        SourceDocument(content=f"content {i}", source="some source")
+        for i in range(UPLOAD_BATCH_SIZE + 1)
+    ]
+
+    # when
+    push_embedder.embed_file(
+        "some-url",
+        "some-file-name.pdf",
+    )
+
+    # then
+    upload_documents = (
+        azure_search_helper_mock.return_value.get_search_client.return_value.upload_documents
+    )
+    assert upload_documents.call_count == 2
+    assert len(upload_documents.call_args_list[0][0][0]) == UPLOAD_BATCH_SIZE
+    assert len(upload_documents.call_args_list[1][0][0]) == 1
+
+
 def test_embed_file_raises_exception_on_failure(
     azure_search_helper_mock,
 ):
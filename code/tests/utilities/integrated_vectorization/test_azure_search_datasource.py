@@ -40,7 +40,7 @@ def env_helper_mock():
 @pytest.fixture(autouse=True)
 def search_indexer_client_mock():
     with patch(
-        "backend.batch.utilities.integrated_vectorization.azure_search_datasource.SearchIndexerClient"
+        "backend.batch.utilities.integrated_vectorization.azure_search_datasource.get_search_indexer_client"
     ) as mock:
         yield mock
 
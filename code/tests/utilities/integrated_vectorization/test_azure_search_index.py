@@ -25,10 +25,22 @@ def env_helper_mock():
         env_helper.AZURE_SEARCH_KEY = AZURE_SEARCH_KEY
         env_helper.AZURE_SEARCH_SERVICE = AZURE_SEARCH_SERVICE
         env_helper.AZURE_SEARCH_INDEX = AZURE_SEARCH_INDEX
+        env_helper.AZURE_OPENAI_EMBEDDING_DIMENSIONS = ""
+        env_helper.AZURE_SEARCH_USE_EXHAUSTIVE_KNN = False
+        env_helper.AZURE_SEARCH_HNSW_M = 4
+        env_helper.AZURE_SEARCH_HNSW_EF_CONSTRUCTION = 400
+        env_helper.AZURE_SEARCH_HNSW_EF_SEARCH = 500
 
         yield env_helper
 
 
+@pytest.fixture(autouse=True)
+def reset_search_dimensions():
+    AzureSearchIndex._search_dimension = None
+    yield
+    AzureSearchIndex._search_dimension = None
+
+
 @pytest.fixture(autouse=True)
 def llm_helper_mock():
     with patch(
@@ -45,7 +57,7 @@ def llm_helper_mock():
 @pytest.fixture(autouse=True)
 def search_index_client_mock():
     with patch(
-        "backend.batch.utilities.integrated_vectorization.azure_search_index.SearchIndexClient"
+        "backend.batch.utilities.integrated_vectorization.azure_search_index.get_search_index_client"
     ) as mock:
         indexer_client = mock.return_value
         indexer_client.create_or_update_index.return_value = SearchIndex(
@@ -93,3 +105,80 @@ def test_create_or_update_index_rbac(
     assert result.fields == ANY
     assert result.vector_search is not None
     search_index_client_mock.return_value.create_or_update_index.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "use_exhaustive_knn,expected_profile",
+    [(False, "myHnswProfile"), (True, "myExhaustiveKnnProfile")],
+)
+def test_create_or_update_index_content_vector_profile(
+    env_helper_mock: MagicMock,
+    llm_helper_mock: MagicMock,
+    search_index_client_mock: MagicMock,
+    use_exhaustive_knn: bool,
+    expected_profile: str,
+):
+    # given
+    env_helper_mock.AZURE_SEARCH_USE_EXHAUSTIVE_KNN = use_exhaustive_knn
+    azure_search_iv_index_helper = AzureSearchIndex(env_helper_mock, llm_helper_mock)
+
+    # when
+    azure_search_iv_index_helper.create_or_update_index()
+
+    # then
+    index = search_index_client_mock.return_value.create_or_update_index.call_args[0][0]
+    content_vector_field = next(
+        field for field in index.fields if field.name == "content_vector"
+    )
+    assert content_vector_field.vector_search_profile_name == expected_profile
+
+
+def test_search_dimensions_probes_embedding_model(
+    env_helper_mock: MagicMock,
+    llm_helper_mock: MagicMock,
+):
+    # given
+    azure_search_iv_index_helper = AzureSearchIndex(env_helper_mock, llm_helper_mock)
+
+    # when
+    search_dimensions = azure_search_iv_index_helper.search_dimensions
+
+    # then
+    assert search_dimensions == 1536
+    llm_helper_mock.get_embedding_model.return_value.embed_query.assert_called_once()
+
+
+def test_search_dimensions_uses_configured_dimensions(
+    env_helper_mock: MagicMock,
+    llm_helper_mock: MagicMock,
+):
+    # given
+    env_helper_mock.AZURE_OPENAI_EMBEDDING_DIMENSIONS = "3072"
+    azure_search_iv_index_helper = AzureSearchIndex(env_helper_mock, llm_helper_mock)
+
+    # when
+    search_dimensions = azure_search_iv_index_helper.search_dimensions
+
+    # then
+    assert search_dimensions == 3072
+    llm_helper_mock.get_embedding_model.return_value.embed_query.assert_not_called()
+
+
+def test_get_vector_search_config_uses_hnsw_parameters_from_env(
+    env_helper_mock: MagicMock,
+    llm_helper_mock: MagicMock,
+):
+    # given
+    env_helper_mock.AZURE_SEARCH_HNSW_M = 16
+    env_helper_mock.AZURE_SEARCH_HNSW_EF_CONSTRUCTION = 200
+    env_helper_mock.AZURE_SEARCH_HNSW_EF_SEARCH = 100
+    azure_search_iv_index_helper = AzureSearchIndex(env_helper_mock, llm_helper_mock)
+
+    # when
+    vector_search = azure_search_iv_index_helper.get_vector_search_config()
+
+    # then
+    hnsw_parameters = vector_search.algorithms[0].parameters
+    assert hnsw_parameters.m == 16
+    assert hnsw_parameters.ef_construction == 200
+    assert hnsw_parameters.ef_search == 100
@@ -1,8 +1,17 @@
 import pytest
 from unittest.mock import ANY, MagicMock, patch
+from azure.core.exceptions import ResourceNotFoundError
+from azure.search.documents.indexes.models import IndexingParameters, SearchIndexer
+from backend.batch.utilities.integrated_vectorization import (
+    azure_search_indexer as azure_search_indexer_module,
+)
 from backend.batch.utilities.integrated_vectorization.azure_search_indexer import (
     AzureSearchIndexer,
 )
+from backend.batch.utilities.integrated_vectorization.definition_cache import (
+    clear_applied_results,
+    get_definition_hash,
+)
 
 AZURE_AUTH_TYPE = "keys"
 AZURE_SEARCH_KEY = "mock-key"
@@ -24,10 +33,24 @@ def env_helper_mock():
         yield env_helper
 
 
+@pytest.fixture(autouse=True)
+def clear_applied_definitions():
+    clear_applied_results()
+    yield
+    clear_applied_results()
+
+
+@pytest.fixture(autouse=True)
+def clear_indexer_exists_cache():
+    azure_search_indexer_module._indexer_exists_cache.clear()
+    yield
+    azure_search_indexer_module._indexer_exists_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def search_indexer_client_mock():
     with patch(
-        "backend.batch.utilities.integrated_vectorization.azure_search_indexer.SearchIndexerClient"
+        "backend.batch.utilities.integrated_vectorization.azure_search_indexer.get_search_indexer_client"
     ) as mock:
         yield mock
 
@@ -61,13 +84,15 @@ def test_create_or_update_indexer_keys(
         skillset_name="skillset_name",
         target_index_name=env_helper_mock.AZURE_SEARCH_INDEX,
         data_source_name=env_helper_mock.AZURE_SEARCH_DATASOURCE_NAME,
-        parameters={
-            "configuration": {
-                "dataToExtract": "contentAndMetadata",
-                "parsingMode": "default",
-                "imageAction": "generateNormalizedImages",
+        parameters=IndexingParameters.from_dict(
+            {
+                "configuration": {
+                    "dataToExtract": "contentAndMetadata",
+                    "parsingMode": "default",
+                    "imageAction": "generateNormalizedImages",
+                }
             }
-        },
+        ),
         field_mappings=ANY,
     )
 
@@ -95,17 +120,46 @@ def test_create_or_update_indexer_rbac(
         skillset_name="skillset_name",
         target_index_name=env_helper_mock.AZURE_SEARCH_INDEX,
         data_source_name=env_helper_mock.AZURE_SEARCH_DATASOURCE_NAME,
-        parameters={
-            "configuration": {
-                "dataToExtract": "contentAndMetadata",
-                "parsingMode": "default",
-                "imageAction": "generateNormalizedImages",
+        parameters=IndexingParameters.from_dict(
+            {
+                "configuration": {
+                    "dataToExtract": "contentAndMetadata",
+                    "parsingMode": "default",
+                    "imageAction": "generateNormalizedImages",
+                }
             }
-        },
+        ),
         field_mappings=ANY,
     )
 
 
+def test_create_or_update_indexer_definition_can_be_hashed(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    search_indexer_mock: MagicMock,
+):
+    # given
+    search_indexer_mock.side_effect = SearchIndexer
+    env_helper_mock.AZURE_SEARCH_DATASOURCE_NAME = "mock-datasource"
+    azure_search_indexer = AzureSearchIndexer(env_helper_mock)
+
+    # when
+    azure_search_indexer.create_or_update_indexer("indexer_name", "skillset_name")
+
+    # then
+    indexer = azure_search_indexer.indexer_client.create_or_update_indexer.call_args[0][
+        0
+    ]
+    assert get_definition_hash(indexer)
+    assert indexer.serialize()["parameters"] == {
+        "configuration": {
+            "dataToExtract": "contentAndMetadata",
+            "parsingMode": "default",
+            "imageAction": "generateNormalizedImages",
+        }
+    }
+
+
 def test_run_indexer(
     env_helper_mock: MagicMock,
     search_indexer_client_mock: MagicMock,
@@ -118,6 +172,25 @@ def test_run_indexer(
     # when
     azure_search_indexer.run_indexer(indexer_name)
 
+    # then
+    azure_search_indexer.indexer_client.reset_indexer.assert_not_called()
+    azure_search_indexer.indexer_client.run_indexer.assert_called_once_with(
+        indexer_name
+    )
+
+
+def test_run_indexer_force_reset(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    search_indexer_mock: MagicMock,
+):
+    # given
+    indexer_name = "indexer_name"
+    azure_search_indexer = AzureSearchIndexer(env_helper_mock)
+
+    # when
+    azure_search_indexer.run_indexer(indexer_name, force_reset=True)
+
     # then
     azure_search_indexer.indexer_client.reset_indexer.assert_called_once_with(
         indexer_name
@@ -135,12 +208,68 @@ def test_indexer_exists(
     # given
     indexer_name = "indexer_name"
     azure_search_indexer = AzureSearchIndexer(env_helper_mock)
-    search_indexer_client_mock.return_value.get_indexer_names.return_value = [
-        "indexer_name"
-    ]
 
     # when
     result = azure_search_indexer.indexer_exists(indexer_name)
 
     # then
     assert result is True
+    search_indexer_client_mock.return_value.get_indexer.assert_called_once_with(
+        indexer_name
+    )
+
+
+def test_indexer_exists_returns_false_when_indexer_not_found(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    search_indexer_mock: MagicMock,
+):
+    # given
+    azure_search_indexer = AzureSearchIndexer(env_helper_mock)
+    search_indexer_client_mock.return_value.get_indexer.side_effect = (
+        ResourceNotFoundError()
+    )
+
+    # when
+    result = azure_search_indexer.indexer_exists("indexer_name")
+
+    # then
+    assert result is False
+
+
+def test_indexer_exists_caches_result(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    search_indexer_mock: MagicMock,
+):
+    # given
+    azure_search_indexer = AzureSearchIndexer(env_helper_mock)
+
+    # when
+    first_result = azure_search_indexer.indexer_exists("indexer_name")
+    second_result = azure_search_indexer.indexer_exists("indexer_name")
+
+    # then
+    assert first_result is True
+    assert second_result is True
+    search_indexer_client_mock.return_value.get_indexer.assert_called_once()
+
+
+def test_create_or_update_indexer_invalidates_indexer_exists_cache(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    search_indexer_mock: MagicMock,
+):
+    # given
+    azure_search_indexer = AzureSearchIndexer(env_helper_mock)
+    search_indexer_client_mock.return_value.get_indexer.side_effect = (
+        ResourceNotFoundError()
+    )
+    assert azure_search_indexer.indexer_exists("indexer_name") is False
+    search_indexer_client_mock.return_value.get_indexer.side_effect = None
+
+    # when
+    azure_search_indexer.create_or_update_indexer("indexer_name", "skillset_name")
+
+    # then
+    assert azure_search_indexer.indexer_exists("indexer_name") is True
@@ -3,6 +3,9 @@ from unittest.mock import MagicMock, patch
 from backend.batch.utilities.integrated_vectorization.azure_search_skillset import (
     AzureSearchSkillset,
 )
+from backend.batch.utilities.integrated_vectorization.definition_cache import (
+    clear_applied_results,
+)
 from azure.search.documents.indexes.models import (
     SearchIndexerSkillset,
     SplitSkill,
@@ -36,10 +39,17 @@ def env_helper_mock():
         yield env_helper
 
 
+@pytest.fixture(autouse=True)
+def clear_applied_definitions():
+    clear_applied_results()
+    yield
+    clear_applied_results()
+
+
 @pytest.fixture(autouse=True)
 def search_indexer_client_mock():
     with patch(
-        "backend.batch.utilities.integrated_vectorization.azure_search_skillset.SearchIndexerClient"
+        "backend.batch.utilities.integrated_vectorization.azure_search_skillset.get_search_indexer_client"
     ) as mock:
         indexer_client = mock.return_value
         indexer_client.create_or_update_skillset.return_value = SearchIndexerSkillset(
@@ -87,3 +97,84 @@ def test_create_skillset_rbac(
     assert len(create_or_update_skillset.skills) == 4
     assert create_or_update_skillset.index_projections is not None
     search_indexer_client_mock.return_value.create_or_update_skillset.assert_called_once()
+
+
+def test_create_skillset_skips_put_when_definition_unchanged(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+):
+    # given
+    config = MagicMock()
+    azure_search_iv_skillset_helper = AzureSearchSkillset(env_helper_mock, config)
+    first_result = azure_search_iv_skillset_helper.create_skillset()
+
+    # when
+    second_result = azure_search_iv_skillset_helper.create_skillset()
+
+    # then
+    assert second_result is first_result
+    search_indexer_client_mock.return_value.create_or_update_skillset.assert_called_once()
+
+
+def test_create_skillset_embedding_skill_uses_key_only_with_keys_auth(
+    env_helper_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+):
+    # given
+    config = MagicMock()
+    env_helper_mock.is_auth_type_keys.return_value = False
+    azure_search_iv_skillset_helper = AzureSearchSkillset(env_helper_mock, config)
+
+    # when
+    azure_search_iv_skillset_helper.create_skillset()
+
+    # then
+    indexer_client = search_indexer_client_mock.return_value
+    skillset = indexer_client.create_or_update_skillset.call_args[0][0]
+    embedding_skill = skillset.skills[3]
+    assert embedding_skill.resource_uri == AZURE_OPENAI_ENDPOINT
+    assert embedding_skill.deployment_id == AZURE_OPENAI_EMBEDDING_MODEL
+    assert embedding_skill.api_key is None
+
+
+@pytest.mark.parametrize(
+    "max_page_length,page_overlap_length,expected_warning",
+    [("800", "100", False), ("800", "60", True)],
+)
+@patch("backend.batch.utilities.integrated_vectorization.azure_search_skillset.logger")
+def test_create_skillset_warns_when_page_overlap_too_small(
+    logger_mock: MagicMock,
+    env_helper_mock: MagicMock,
+    max_page_length: str,
+    page_overlap_length: str,
+    expected_warning: bool,
+):
+    # given
+    config = MagicMock()
+    config.max_page_length = max_page_length
+    config.page_overlap_length = page_overlap_length
+    azure_search_iv_skillset_helper = AzureSearchSkillset(env_helper_mock, config)
+
+    # when
+    azure_search_iv_skillset_helper.create_skillset()
+
+    # then
+    assert logger_mock.warning.called is expected_warning
+
+
+@patch("backend.batch.utilities.integrated_vectorization.azure_search_skillset.logger")
+def test_page_overlap_warning_ignores_non_numeric_lengths(
+    logger_mock: MagicMock,
+    env_helper_mock: MagicMock,
+):
+    # given
+    config = MagicMock()
+    config.max_page_length = "800"
+    config.page_overlap_length = "abc"
+    azure_search_iv_skillset_helper = AzureSearchSkillset(env_helper_mock, config)
+
+    # when
+    azure_search_iv_skillset_helper._warn_if_page_overlap_too_small()
+
+    # then
+    logger_mock.warning.assert_not_called()
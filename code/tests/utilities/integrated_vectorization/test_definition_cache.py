@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from backend.batch.utilities.integrated_vectorization.definition_cache import (
+    APPLIED_DEFINITION_CACHE_TTL_SECONDS,
+    clear_applied_results,
+    get_applied_result,
+    get_definition_hash,
+    set_applied_result,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_applied_definitions():
+    clear_applied_results()
+    yield
+    clear_applied_results()
+
+
+def definition(as_dict: dict):
+    definition = MagicMock()
+    definition.as_dict.return_value = as_dict
+    return definition
+
+
+def test_get_definition_hash_ignores_key_order():
+    # when
+    first_hash = get_definition_hash(definition({"name": "a", "skills": [1, 2]}))
+    second_hash = get_definition_hash(definition({"skills": [1, 2], "name": "a"}))
+
+    # then
+    assert first_hash == second_hash
+
+
+def test_get_applied_result_returns_result_for_same_definition():
+    # given
+    definition_hash = get_definition_hash(definition({"name": "a"}))
+    result = MagicMock()
+    set_applied_result("service", "skillset", "a", definition_hash, result)
+
+    # when
+    applied_result = get_applied_result("service", "skillset", "a", definition_hash)
+
+    # then
+    assert applied_result is result
+
+
+def test_get_applied_result_returns_none_for_changed_definition():
+    # given
+    set_applied_result(
+        "service",
+        "skillset",
+        "a",
+        get_definition_hash(definition({"name": "a"})),
+        MagicMock(),
+    )
+
+    # when
+    applied_result = get_applied_result(
+        "service",
+        "skillset",
+        "a",
+        get_definition_hash(definition({"name": "a", "x": 1})),
+    )
+
+    # then
+    assert applied_result is None
+
+
+def test_get_applied_result_returns_none_for_other_search_service():
+    # given
+    definition_hash = get_definition_hash(definition({"name": "a"}))
+    set_applied_result("service", "skillset", "a", definition_hash, MagicMock())
+
+    # when
+    applied_result = get_applied_result(
+        "other-service", "skillset", "a", definition_hash
+    )
+
+    # then
+    assert applied_result is None
+
+
+@patch(
+    "backend.batch.utilities.integrated_vectorization.definition_cache.time.monotonic"
+)
+def test_get_applied_result_returns_none_after_ttl(monotonic_mock: MagicMock):
+    # given
+    definition_hash = get_definition_hash(definition({"name": "a"}))
+    monotonic_mock.return_value = 1000.0
+    set_applied_result("service", "skillset", "a", definition_hash, MagicMock())
+    monotonic_mock.return_value = 1000.0 + APPLIED_DEFINITION_CACHE_TTL_SECONDS
+
+    # when
+    applied_result = get_applied_result("service", "skillset", "a", definition_hash)
+
+    # then
+    assert applied_result is None
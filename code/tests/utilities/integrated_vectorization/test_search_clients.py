@@ -0,0 +1,148 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from backend.batch.utilities.integrated_vectorization import search_clients
+from backend.batch.utilities.integrated_vectorization.search_clients import (
+    get_search_credential,
+    get_search_index_client,
+    get_search_indexer_client,
+)
+
+AZURE_SEARCH_KEY = "mock-key"
+AZURE_SEARCH_SERVICE = "mock-service"
+
+
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    search_clients._get_default_credential.cache_clear()
+    search_clients._get_key_credential.cache_clear()
+    search_clients._create_search_index_client.cache_clear()
+    search_clients._create_search_indexer_client.cache_clear()
+    yield
+    search_clients._get_default_credential.cache_clear()
+    search_clients._get_key_credential.cache_clear()
+    search_clients._create_search_index_client.cache_clear()
+    search_clients._create_search_indexer_client.cache_clear()
+
+
+@pytest.fixture
+def env_helper_mock():
+    env_helper = MagicMock()
+    env_helper.AZURE_SEARCH_KEY = AZURE_SEARCH_KEY
+    env_helper.AZURE_SEARCH_SERVICE = AZURE_SEARCH_SERVICE
+    env_helper.is_auth_type_keys.return_value = True
+    return env_helper
+
+
+@pytest.fixture(autouse=True)
+def search_index_client_mock():
+    with patch(
+        "backend.batch.utilities.integrated_vectorization.search_clients.SearchIndexClient"
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def search_indexer_client_mock():
+    with patch(
+        "backend.batch.utilities.integrated_vectorization.search_clients.SearchIndexerClient"
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def default_azure_credential_mock():
+    with patch(
+        "backend.batch.utilities.integrated_vectorization.search_clients.DefaultAzureCredential"
+    ) as mock:
+        yield mock
+
+
+@patch(
+    "backend.batch.utilities.integrated_vectorization.search_clients.AzureKeyCredential"
+)
+def test_get_search_index_client_keys(
+    azure_key_credential_mock: MagicMock,
+    env_helper_mock: MagicMock,
+    search_index_client_mock: MagicMock,
+):
+    # when
+    client = get_search_index_client(env_helper_mock)
+
+    # then
+    assert client is search_index_client_mock.return_value
+    azure_key_credential_mock.assert_called_once_with(AZURE_SEARCH_KEY)
+    search_index_client_mock.assert_called_once_with(
+        AZURE_SEARCH_SERVICE, azure_key_credential_mock.return_value
+    )
+
+
+def test_get_search_index_client_is_reused(
+    env_helper_mock: MagicMock,
+    search_index_client_mock: MagicMock,
+):
+    # when
+    first_client = get_search_index_client(env_helper_mock)
+    second_client = get_search_index_client(env_helper_mock)
+
+    # then
+    assert first_client is second_client
+    search_index_client_mock.assert_called_once()
+
+
+def test_clients_share_default_credential_with_rbac(
+    env_helper_mock: MagicMock,
+    search_index_client_mock: MagicMock,
+    search_indexer_client_mock: MagicMock,
+    default_azure_credential_mock: MagicMock,
+):
+    # given
+    env_helper_mock.is_auth_type_keys.return_value = False
+
+    # when
+    get_search_index_client(env_helper_mock)
+    get_search_indexer_client(env_helper_mock)
+
+    # then
+    default_azure_credential_mock.assert_called_once_with()
+    search_index_client_mock.assert_called_once_with(
+        AZURE_SEARCH_SERVICE, default_azure_credential_mock.return_value
+    )
+    search_indexer_client_mock.assert_called_once_with(
+        AZURE_SEARCH_SERVICE, default_azure_credential_mock.return_value
+    )
+
+
+def test_get_search_index_client_raises_when_key_missing_with_keys_auth(
+    env_helper_mock: MagicMock,
+    search_index_client_mock: MagicMock,
+    default_azure_credential_mock: MagicMock,
+):
+    # given
+    env_helper_mock.AZURE_SEARCH_KEY = ""
+
+    # when
+    with pytest.raises(Exception) as exc_info:
+        get_search_index_client(env_helper_mock)
+
+    # then
+    assert str(exc_info.value) == (
+        "AZURE_SEARCH_KEY must be set when AZURE_AUTH_TYPE is keys"
+    )
+    search_index_client_mock.assert_not_called()
+    default_azure_credential_mock.assert_not_called()
+
+
+@patch(
+    "backend.batch.utilities.integrated_vectorization.search_clients.AzureKeyCredential"
+)
+def test_get_search_credential_reuses_key_credential(
+    azure_key_credential_mock: MagicMock,
+    env_helper_mock: MagicMock,
+):
+    # when
+    first_credential = get_search_credential(env_helper_mock)
+    second_credential = get_search_credential(env_helper_mock)
+
+    # then
+    assert first_credential is second_credential
+    azure_key_credential_mock.assert_called_once_with(AZURE_SEARCH_KEY)